@@ -6,20 +6,25 @@ ServiceNow MCP server, suitable for deployment as a remote MCP endpoint.
 """
 
 import argparse
+import hmac
+import json
 import logging
 import os
 import sys
-from typing import Optional, Union
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Awaitable, Callable, ClassVar, Optional, TypeVar, Union
 
+import anyio
 import uvicorn
 from dotenv import load_dotenv
 from mcp.server import Server
 from mcp.server.sse import SseServerTransport
+from sse_starlette.sse import EventSourceResponse
 from starlette.applications import Starlette
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from starlette.routing import Mount, Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from servicenow_mcp.server import ServiceNowMCP
 from servicenow_mcp.utils.config import (
@@ -31,14 +36,58 @@ from servicenow_mcp.utils.config import (
     ServerConfig,
 )
 
+if TYPE_CHECKING:
+    from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+    from mcp.server.models import InitializationOptions
+    from mcp.types import JSONRPCMessage
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+# Header names as they appear in ASGI scopes (lowercased bytes).
+_AUTHORIZATION = b"authorization"
+_X_API_KEY = b"x-api-key"
+_AUTO_KEY_HEADERS = frozenset({_AUTHORIZATION, _X_API_KEY})
+
+# The 401 response never varies, so serialize it once at import time.
+_UNAUTHORIZED_BODY = json.dumps(
+    {"error": "Unauthorized", "message": "Invalid or missing API key"}
+).encode("utf-8")
+# An explicit Content-Length lets the server write the response in one go, and
+# closing the connection stops a key-guessing client from reusing the socket.
+_UNAUTHORIZED_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_UNAUTHORIZED_BODY)).encode()),
+    (b"connection", b"close"),
+]
+
+_TOO_MANY_CONNECTIONS_BODY = json.dumps(
+    {"error": "Too Many Requests", "message": "Too many concurrent SSE connections"}
+).encode("utf-8")
+_TOO_MANY_CONNECTIONS_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_TOO_MANY_CONNECTIONS_BODY)).encode()),
+]
+
+# Streaming headers for /sse: stop caches from storing the stream and tell
+# Nginx (X-Accel-Buffering) to flush each event instead of buffering it.
+_SSE_STREAM_HEADERS = (
+    (b"cache-control", b"no-store"),
+    (b"x-accel-buffering", b"no"),
+    (b"connection", b"keep-alive"),
+)
+_SSE_STREAM_HEADER_NAMES = frozenset(name for name, _ in _SSE_STREAM_HEADERS)
+
+_HEALTHZ_BODY = json.dumps({"status": "ok"}).encode("utf-8")
+
+# Paths served without an inbound API key unless MCP_SERVER_API_KEY_BYPASS_PATHS is set.
+_DEFAULT_BYPASS_PATHS = frozenset({"/healthz"})
 
-class ApiKeyMiddleware(BaseHTTPMiddleware):
+
+class ApiKeyMiddleware:
     """
     Middleware to validate inbound API keys on all SSE/messages requests.
 
@@ -50,33 +99,221 @@ class ApiKeyMiddleware(BaseHTTPMiddleware):
        - Check Authorization: Bearer <key> first
        - Fall back to X-API-Key header
 
-    Returns 401 JSON if the key is missing or does not match.
+    Returns 401 JSON if the key is missing or does not match. Requests whose
+    path is in ``bypass_paths`` (e.g. health probes) skip the check entirely.
+
+    Implemented as a pure ASGI middleware: the key check only needs the raw
+    request headers, and wrapping the app this way keeps streaming responses
+    such as /sse flowing straight through to the client without buffering.
     """
 
-    def __init__(self, app, api_key: str, header_name: Optional[str] = None):
-        super().__init__(app)
+    def __init__(
+        self,
+        app: ASGIApp,
+        api_key: str,
+        header_name: Optional[str] = None,
+        bypass_paths: frozenset[str] = frozenset(),
+    ):
+        self.app = app
         self.api_key = api_key
         self.header_name = header_name
+        self.bypass_paths = frozenset(bypass_paths)
+        self._api_key_b = api_key.encode("utf-8")
+        self.header_name_bytes = header_name.lower().encode() if header_name else None
+        # Choose the header lookup once rather than branching on every request.
+        if self.header_name_bytes is not None:
+            self._extract = self._extract_custom
+        else:
+            self._extract = self._extract_auto
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.bypass_paths:
+            await self.app(scope, receive, send)
+            return
+
+        provided_key = self._extract(scope["headers"])
+        if provided_key is None or not hmac.compare_digest(provided_key, self._api_key_b):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 401,
+                    "headers": _UNAUTHORIZED_HEADERS,
+                }
+            )
+            await send({"type": "http.response.body", "body": _UNAUTHORIZED_BODY})
+            return
 
-    async def dispatch(self, request: Request, call_next):
-        provided_key = None
+        await self.app(scope, receive, send)
 
-        if self.header_name:
-            provided_key = request.headers.get(self.header_name)
-        else:
-            auth_header = request.headers.get("Authorization", "")
-            if auth_header.startswith("Bearer "):
-                provided_key = auth_header[7:]
-            else:
-                provided_key = request.headers.get("X-API-Key")
+    def _extract_custom(self, headers: list[tuple[bytes, bytes]]) -> Optional[bytes]:
+        """Return the value of the configured key header, or None if absent."""
+        header_name = self.header_name_bytes
+        for name, value in headers:
+            if name == header_name:
+                return value
+        return None
+
+    def _extract_auto(self, headers: list[tuple[bytes, bytes]]) -> Optional[bytes]:
+        """
+        Return the key from Authorization: Bearer, else X-API-Key, or None if absent.
+
+        Scans the header list once, matching both header names at the same time,
+        and stops as soon as a Bearer token is found.
+        """
+        x_api_key = None
+        authorization_seen = False
+        for name, value in headers:
+            if name not in _AUTO_KEY_HEADERS:
+                continue
+            if name == _AUTHORIZATION:
+                if authorization_seen:
+                    continue
+                if value.startswith(b"Bearer "):
+                    return value[7:]
+                authorization_seen = True
+            elif x_api_key is None:
+                x_api_key = value
+        return x_api_key
+
+
+class ConnectionQuotaMiddleware:
+    """
+    Middleware that caps the number of concurrent /sse connections per client IP.
 
-        if provided_key != self.api_key:
-            return JSONResponse(
-                {"error": "Unauthorized", "message": "Invalid or missing API key"},
-                status_code=401,
+    Activated only when MCP_SSE_MAX_CONN_PER_IP is set. A connection counts
+    against its IP for as long as the inner app is serving it, so a long-lived
+    SSE stream holds its slot until it closes. Returns 429 JSON above the limit.
+
+    The client IP comes from the ASGI scope; behind a reverse proxy, configure
+    uvicorn's FORWARDED_ALLOW_IPS so it reflects the real client.
+    """
+
+    def __init__(self, app: ASGIApp, limit: int, path: str = "/sse"):
+        self.app = app
+        self.limit = limit
+        self.path = path
+        self._counts: dict[str, int] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] != self.path:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        ip = client[0] if client else ""
+        count = self._counts.get(ip, 0)
+        if count >= self.limit:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 429,
+                    "headers": _TOO_MANY_CONNECTIONS_HEADERS,
+                }
             )
+            await send({"type": "http.response.body", "body": _TOO_MANY_CONNECTIONS_BODY})
+            return
+
+        self._counts[ip] = count + 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            remaining = self._counts[ip] - 1
+            if remaining:
+                self._counts[ip] = remaining
+            else:
+                del self._counts[ip]
+
+
+def _with_sse_headers(send: Send) -> Send:
+    """
+    Wrap send so the /sse response start carries the streaming headers.
+
+    _SSE_STREAM_HEADERS replace any values set by the transport, and a
+    text/event-stream content type is added if none is present. Every other
+    message is passed through untouched.
+    """
+
+    async def send_with_sse_headers(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = [
+                (name, value)
+                for name, value in message.get("headers", ())
+                if name.lower() not in _SSE_STREAM_HEADER_NAMES
+            ]
+            headers.extend(_SSE_STREAM_HEADERS)
+            if not any(name.lower() == b"content-type" for name, _ in headers):
+                headers.append((b"content-type", b"text/event-stream"))
+            message = {**message, "headers": headers}
+        await send(message)
+
+    return send_with_sse_headers
+
+
+class _ASGIEndpoint:
+    """
+    Expose a bare ``(scope, receive, send)`` coroutine as a Starlette route endpoint.
+
+    Starlette wraps plain functions in a Request/Response adapter; wrapping the
+    handler in a callable object makes the route call it as raw ASGI instead.
+    """
+
+    def __init__(self, handler: ASGIApp):
+        self.handler = handler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.handler(scope, receive, send)
+
 
-        return await call_next(request)
+async def _run_with_idle_timeout(
+    run_session: Callable[..., Awaitable[None]],
+    read_stream: "MemoryObjectReceiveStream[JSONRPCMessage | Exception]",
+    write_stream: "MemoryObjectSendStream[JSONRPCMessage]",
+    initialization_options: "InitializationOptions",
+    idle_timeout: float,
+) -> None:
+    """
+    Run an MCP session, ending it once the client has been idle for idle_timeout seconds.
+
+    Client messages are relayed through an extra memory stream so each one can
+    record its arrival time; a watchdog sleeps until the resulting deadline.
+    Times come from the event loop's monotonic clock, never the wall clock.
+    """
+    current_time = anyio.current_time
+    relay_send: MemoryObjectSendStream[JSONRPCMessage | Exception]
+    relay_receive: MemoryObjectReceiveStream[JSONRPCMessage | Exception]
+    relay_send, relay_receive = anyio.create_memory_object_stream(0)
+    last_activity = current_time()
+
+    async def relay_client_messages() -> None:
+        nonlocal last_activity
+        async with relay_send:
+            async for message in read_stream:
+                last_activity = current_time()
+                await relay_send.send(message)
+
+    try:
+        async with anyio.create_task_group() as tg:
+
+            async def reap_when_idle() -> None:
+                while True:
+                    remaining = last_activity + idle_timeout - current_time()
+                    if remaining <= 0:
+                        break
+                    await anyio.sleep(remaining)
+                logger.info("Closing SSE session after %ss without client activity", idle_timeout)
+                tg.cancel_scope.cancel()
+
+            tg.start_soon(relay_client_messages)
+            tg.start_soon(reap_when_idle)
+            await run_session(relay_receive, write_stream, initialization_options)
+            tg.cancel_scope.cancel()
+    finally:
+        # Closing the write side ends the transport's event stream, which
+        # lets connect_sse finish the HTTP response and release the connection.
+        # Closing the read side makes late POSTs to /messages/ fail fast instead
+        # of blocking forever on a session nobody reads any more.
+        await write_stream.aclose()
+        await read_stream.aclose()
 
 
 def create_starlette_app(
@@ -85,6 +322,9 @@ def create_starlette_app(
     debug: bool = False,
     inbound_api_key: Optional[str] = None,
     inbound_api_key_header: Optional[str] = None,
+    inbound_api_key_bypass_paths: frozenset[str] = _DEFAULT_BYPASS_PATHS,
+    sse_idle_timeout_sec: int = 300,
+    sse_max_conn_per_ip: Optional[int] = None,
 ) -> Starlette:
     """
     Create a Starlette application that serves the provided MCP server with SSE.
@@ -95,25 +335,54 @@ def create_starlette_app(
         inbound_api_key: If set, all requests must present this key.
         inbound_api_key_header: Custom header to check for the inbound key.
                                 If None, checks Authorization Bearer then X-API-Key.
+        inbound_api_key_bypass_paths: Paths that are served without checking the
+                                      inbound key. Defaults to the /healthz probe.
+        sse_idle_timeout_sec: Close an SSE session after this many seconds without
+                              a client message. 0 disables the idle timeout.
+        sse_max_conn_per_ip: If set, reject /sse connections with 429 once a client
+                             IP already holds this many.
     """
     sse = SseServerTransport("/messages/")
 
-    async def handle_sse(request: Request) -> None:
-        async with sse.connect_sse(
-            request.scope,
-            request.receive,
-            request._send,  # noqa: SLF001
-        ) as (read_stream, write_stream):
-            await mcp_server.run(
+    async def handle_healthz(request: Request) -> Response:
+        return Response(_HEALTHZ_BODY, media_type="application/json")
+
+    # Initialization options only depend on the handlers registered on the
+    # server, which are fixed by now, so build them once for every connection.
+    init_opts = mcp_server.create_initialization_options()
+
+    # Bind the per-connection callables once instead of looking them up on
+    # every new SSE connection.
+    connect_sse = sse.connect_sse
+    run_session = mcp_server.run
+
+    async def handle_sse(scope: Scope, receive: Receive, send: Send) -> None:
+        # connect_sse stops streaming when the client disconnects but leaves the
+        # MCP session running, so cancel the whole connection on disconnect.
+        with anyio.CancelScope() as connection_scope:
+
+            async def receive_until_disconnect() -> Message:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    connection_scope.cancel()
+                return message
+
+            async with connect_sse(scope, receive_until_disconnect, _with_sse_headers(send)) as (
                 read_stream,
                 write_stream,
-                mcp_server.create_initialization_options(),
-            )
+            ):
+                if sse_idle_timeout_sec > 0:
+                    await _run_with_idle_timeout(
+                        run_session, read_stream, write_stream, init_opts, sse_idle_timeout_sec
+                    )
+                else:
+                    await run_session(read_stream, write_stream, init_opts)
 
     app = Starlette(
         debug=debug,
         routes=[
-            Route("/sse", endpoint=handle_sse),
+            Route("/healthz", endpoint=handle_healthz),
+            Route("/sse", endpoint=_ASGIEndpoint(handle_sse), methods=["GET"]),
             Mount("/messages/", app=sse.handle_post_message),
         ],
     )
@@ -123,11 +392,115 @@ def create_starlette_app(
             ApiKeyMiddleware,
             api_key=inbound_api_key,
             header_name=inbound_api_key_header,
+            bypass_paths=inbound_api_key_bypass_paths,
         )
 
+    # Added last so it wraps ApiKeyMiddleware and turns away excess
+    # connections before any key checking.
+    if sse_max_conn_per_ip:
+        app.add_middleware(ConnectionQuotaMiddleware, limit=sse_max_conn_per_ip)
+
     return app
 
 
+@dataclass(frozen=True)
+class _SseRuntimeSettings:
+    """Environment-derived settings for the SSE server, snapshotted once at startup."""
+
+    inbound_api_key: Optional[str] = None
+    inbound_api_key_header: Optional[str] = None
+    inbound_api_key_bypass_paths: frozenset[str] = _DEFAULT_BYPASS_PATHS
+    workers: int = 1
+    limit_concurrency: Optional[int] = None
+    backlog: int = 2048
+    timeout_keep_alive: int = 75
+    sse_keepalive_sec: int = 21
+    sse_idle_timeout_sec: int = 300
+    sse_max_conn_per_ip: Optional[int] = None
+
+    # Smallest accepted value for each integer setting; None is always accepted.
+    _MINIMUMS: ClassVar[dict[str, int]] = {
+        "workers": 1,
+        "limit_concurrency": 1,
+        "backlog": 1,
+        "timeout_keep_alive": 0,
+        "sse_keepalive_sec": 1,
+        "sse_idle_timeout_sec": 0,
+        "sse_max_conn_per_ip": 0,
+    }
+
+    def __post_init__(self) -> None:
+        for name, minimum in self._MINIMUMS.items():
+            value = getattr(self, name)
+            if value is not None and value < minimum:
+                raise ValueError(f"{name} must be >= {minimum}, got {value}")
+
+
+# Settings applied by the uvicorn parent process rather than by each worker's app.
+_UVICORN_SETTING_FIELDS = ("workers", "limit_concurrency", "backlog", "timeout_keep_alive")
+
+
+# An int default yields an int; a None default (optional setting) may yield None.
+_IntDefault = TypeVar("_IntDefault", int, None)
+
+
+def _parse_int_env(name: str, raw: Optional[str], default: _IntDefault) -> Union[int, _IntDefault]:
+    """Parse an integer env var value, returning default when it is unset or empty."""
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got '{raw}'") from None
+
+
+def _parse_paths_env(raw: Optional[str]) -> frozenset[str]:
+    """Parse a comma-separated path list, returning the default bypass paths when unset."""
+    if raw is None:
+        return _DEFAULT_BYPASS_PATHS
+    return frozenset(path.strip() for path in raw.split(",") if path.strip())
+
+
+def _load_settings() -> _SseRuntimeSettings:
+    """Read every SSE server env var exactly once into a _SseRuntimeSettings."""
+    env = os.environ
+    return _SseRuntimeSettings(
+        inbound_api_key=env.get("MCP_SERVER_API_KEY"),
+        inbound_api_key_header=env.get("MCP_SERVER_API_KEY_HEADER") or None,
+        inbound_api_key_bypass_paths=_parse_paths_env(env.get("MCP_SERVER_API_KEY_BYPASS_PATHS")),
+        workers=_parse_int_env("MCP_WORKERS", env.get("MCP_WORKERS"), 1),
+        limit_concurrency=_parse_int_env(
+            "MCP_LIMIT_CONCURRENCY", env.get("MCP_LIMIT_CONCURRENCY"), None
+        ),
+        backlog=_parse_int_env("MCP_BACKLOG", env.get("MCP_BACKLOG"), 2048),
+        timeout_keep_alive=_parse_int_env(
+            "MCP_TIMEOUT_KEEP_ALIVE", env.get("MCP_TIMEOUT_KEEP_ALIVE"), 75
+        ),
+        sse_keepalive_sec=_parse_int_env(
+            "MCP_SSE_KEEPALIVE_SEC", env.get("MCP_SSE_KEEPALIVE_SEC"), 21
+        ),
+        sse_idle_timeout_sec=_parse_int_env(
+            "MCP_SSE_IDLE_TIMEOUT_SEC", env.get("MCP_SSE_IDLE_TIMEOUT_SEC"), 300
+        ),
+        sse_max_conn_per_ip=_parse_int_env(
+            "MCP_SSE_MAX_CONN_PER_IP", env.get("MCP_SSE_MAX_CONN_PER_IP"), None
+        ),
+    )
+
+
+def _set_sse_keepalive_interval(seconds: int) -> None:
+    """
+    Set how often /sse streams send a ": ping" keep-alive comment.
+
+    SseServerTransport builds sse_starlette's EventSourceResponse itself, so
+    the interval can only be set through that class's default. This changes
+    it for the whole process and is called once at startup.
+    """
+    if seconds <= 0:
+        raise ValueError(f"sse_keepalive_sec must be > 0, got {seconds}")
+    EventSourceResponse.DEFAULT_PING_INTERVAL = seconds
+
+
 class ServiceNowSSEMCP(ServiceNowMCP):
     """
     ServiceNow MCP Server with SSE transport.
@@ -139,7 +512,13 @@ class ServiceNowSSEMCP(ServiceNowMCP):
     def __init__(self, config: Union[dict, ServerConfig]):
         super().__init__(config)
 
-    def start(self, host: str = "0.0.0.0", port: int = 8080, debug: bool = False):
+    def start(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8080,
+        debug: bool = False,
+        settings: Optional[_SseRuntimeSettings] = None,
+    ):
         """
         Start the MCP server with SSE transport.
 
@@ -147,9 +526,15 @@ class ServiceNowSSEMCP(ServiceNowMCP):
             host: Host address to bind to.
             port: Port to listen on.
             debug: Enable debug mode.
+            settings: Inbound auth and uvicorn settings. Loaded from the
+                      environment when not given. With more than one worker
+                      each process builds its own app via _app_factory.
         """
-        inbound_api_key = os.getenv("MCP_SERVER_API_KEY")
-        inbound_api_key_header = os.getenv("MCP_SERVER_API_KEY_HEADER") or None
+        if settings is None:
+            settings = _load_settings()
+        if settings.workers > 1:
+            self._check_workers_match_env(settings)
+        inbound_api_key = settings.inbound_api_key
 
         if inbound_api_key:
             logger.info("Inbound API key authentication is enabled")
@@ -158,14 +543,150 @@ class ServiceNowSSEMCP(ServiceNowMCP):
                 "MCP_SERVER_API_KEY is not set — the /sse endpoint is unprotected"
             )
 
+        if settings.workers > 1:
+            # uvicorn can only spawn workers from an import string, so every
+            # worker rebuilds the server from the environment (checked above).
+            if debug:
+                logger.warning("Debug mode is ignored when running multiple workers")
+            logger.info("Starting %d uvicorn workers", settings.workers)
+            uvicorn.run(
+                "servicenow_mcp.server_sse:_app_factory",
+                factory=True,
+                workers=settings.workers,
+                host=host,
+                port=port,
+                limit_concurrency=settings.limit_concurrency,
+                backlog=settings.backlog,
+                timeout_keep_alive=settings.timeout_keep_alive,
+            )
+            return
+
+        _set_sse_keepalive_interval(settings.sse_keepalive_sec)
         starlette_app = create_starlette_app(
             self.mcp_server,
             debug=debug,
             inbound_api_key=inbound_api_key,
-            inbound_api_key_header=inbound_api_key_header,
+            inbound_api_key_header=settings.inbound_api_key_header,
+            inbound_api_key_bypass_paths=settings.inbound_api_key_bypass_paths,
+            sse_idle_timeout_sec=settings.sse_idle_timeout_sec,
+            sse_max_conn_per_ip=settings.sse_max_conn_per_ip,
+        )
+
+        uvicorn.run(
+            starlette_app,
+            host=host,
+            port=port,
+            limit_concurrency=settings.limit_concurrency,
+            backlog=settings.backlog,
+            timeout_keep_alive=settings.timeout_keep_alive,
+        )
+
+    def _check_workers_match_env(self, settings: _SseRuntimeSettings) -> None:
+        """
+        Ensure worker processes will rebuild the same server this instance describes.
+
+        Workers get their ServiceNow config and app settings from the environment
+        via _app_factory, so a config or inbound-auth setting passed in any other
+        way would silently be dropped. Only the uvicorn-level settings, which the
+        parent process applies itself, may differ from the environment.
+
+        Raises:
+            ValueError: If the config or app settings differ from the environment.
+        """
+        try:
+            env_config: Optional[ServerConfig] = _config_from_env()
+        except ValueError:
+            env_config = None
+        env_settings = _load_settings()
+        uvicorn_fields = {name: getattr(env_settings, name) for name in _UVICORN_SETTING_FIELDS}
+        if env_config != self.config or replace(settings, **uvicorn_fields) != env_settings:
+            raise ValueError(
+                "Running more than one worker requires the ServiceNow config and inbound "
+                "API key settings to come from environment variables, because each "
+                "worker process rebuilds the server from the environment"
+            )
+
+
+def _app_factory() -> Starlette:
+    """
+    Build the SSE Starlette app from environment variables.
+
+    Used as the uvicorn app factory when running with more than one worker.
+    """
+    load_dotenv()
+    settings = _load_settings()
+    server = ServiceNowSSEMCP(create_config_from_env())
+    _set_sse_keepalive_interval(settings.sse_keepalive_sec)
+    return create_starlette_app(
+        server.mcp_server,
+        inbound_api_key=settings.inbound_api_key,
+        inbound_api_key_header=settings.inbound_api_key_header,
+        inbound_api_key_bypass_paths=settings.inbound_api_key_bypass_paths,
+        sse_idle_timeout_sec=settings.sse_idle_timeout_sec,
+        sse_max_conn_per_ip=settings.sse_max_conn_per_ip,
+    )
+
+
+_BASIC_VARS = ("SERVICENOW_USERNAME", "SERVICENOW_PASSWORD")
+_API_KEY_VARS = ("SERVICENOW_API_KEY",)
+_OAUTH_VARS = (
+    "SERVICENOW_CLIENT_ID",
+    "SERVICENOW_CLIENT_SECRET",
+    "SERVICENOW_USERNAME",
+    "SERVICENOW_PASSWORD",
+)
+
+
+def _require_env(names: tuple[str, ...], auth_label: str) -> list[str]:
+    """Return the values of the named env vars, raising ValueError if any are missing."""
+    values = [os.environ.get(name, "") for name in names]
+    missing = [name for name, value in zip(names, values, strict=True) if not value]
+    if missing:
+        raise ValueError(
+            f"Missing required environment variable(s) for {auth_label} auth: "
+            f"{', '.join(missing)}"
         )
+    return values
 
-        uvicorn.run(starlette_app, host=host, port=port)
+
+def _build_basic_auth(instance_url: str) -> AuthConfig:
+    username, password = _require_env(_BASIC_VARS, "basic")
+    return AuthConfig(
+        type=AuthType.BASIC,
+        basic=BasicAuthConfig(username=username, password=password),
+    )
+
+
+def _build_api_key_auth(instance_url: str) -> AuthConfig:
+    (api_key,) = _require_env(_API_KEY_VARS, "api_key")
+    header_name = os.environ.get("SERVICENOW_API_KEY_HEADER", "X-ServiceNow-API-Key")
+    return AuthConfig(
+        type=AuthType.API_KEY,
+        api_key=ApiKeyConfig(api_key=api_key, header_name=header_name),
+    )
+
+
+def _build_oauth_auth(instance_url: str) -> AuthConfig:
+    client_id, client_secret, username, password = _require_env(_OAUTH_VARS, "oauth")
+    token_url = os.environ.get("SERVICENOW_TOKEN_URL") or f"{instance_url}/oauth_token.do"
+    return AuthConfig(
+        type=AuthType.OAUTH,
+        oauth=OAuthConfig(
+            client_id=client_id,
+            client_secret=client_secret,
+            username=username,
+            password=password,
+            token_url=token_url,
+        ),
+    )
+
+
+# Keyed by the SERVICENOW_AUTH_TYPE value so the env var is looked up directly.
+_AUTH_BUILDERS: dict[str, Callable[[str], AuthConfig]] = {
+    AuthType.BASIC.value: _build_basic_auth,
+    AuthType.API_KEY.value: _build_api_key_auth,
+    AuthType.OAUTH.value: _build_oauth_auth,
+}
 
 
 def create_config_from_env() -> ServerConfig:
@@ -175,66 +696,29 @@ def create_config_from_env() -> ServerConfig:
     Reads SERVICENOW_AUTH_TYPE (basic | oauth | api_key) and constructs
     the appropriate AuthConfig. Raises ValueError for missing required vars.
     """
+    config = _config_from_env()
+    if config.auth.oauth is not None and not os.environ.get("SERVICENOW_TOKEN_URL"):
+        logger.warning(
+            "SERVICENOW_TOKEN_URL not set, defaulting to %s", config.auth.oauth.token_url
+        )
+    return config
+
+
+def _config_from_env() -> ServerConfig:
+    """Build a ServerConfig from environment variables without logging anything."""
     instance_url = os.getenv("SERVICENOW_INSTANCE_URL")
     if not instance_url:
         raise ValueError("SERVICENOW_INSTANCE_URL environment variable is required")
 
     auth_type_str = os.getenv("SERVICENOW_AUTH_TYPE", "basic").lower()
-    try:
-        auth_type = AuthType(auth_type_str)
-    except ValueError:
+    build_auth = _AUTH_BUILDERS.get(auth_type_str)
+    if build_auth is None:
         raise ValueError(
             f"Invalid SERVICENOW_AUTH_TYPE: '{auth_type_str}'. "
             "Must be one of: basic, oauth, api_key"
         )
 
-    if auth_type == AuthType.BASIC:
-        username = os.getenv("SERVICENOW_USERNAME")
-        password = os.getenv("SERVICENOW_PASSWORD")
-        if not username or not password:
-            raise ValueError(
-                "SERVICENOW_USERNAME and SERVICENOW_PASSWORD are required for basic auth"
-            )
-        auth_config = AuthConfig(
-            type=auth_type,
-            basic=BasicAuthConfig(username=username, password=password),
-        )
-
-    elif auth_type == AuthType.API_KEY:
-        api_key = os.getenv("SERVICENOW_API_KEY")
-        if not api_key:
-            raise ValueError("SERVICENOW_API_KEY is required for api_key auth")
-        header_name = os.getenv("SERVICENOW_API_KEY_HEADER", "X-ServiceNow-API-Key")
-        auth_config = AuthConfig(
-            type=auth_type,
-            api_key=ApiKeyConfig(api_key=api_key, header_name=header_name),
-        )
-
-    elif auth_type == AuthType.OAUTH:
-        client_id = os.getenv("SERVICENOW_CLIENT_ID")
-        client_secret = os.getenv("SERVICENOW_CLIENT_SECRET")
-        username = os.getenv("SERVICENOW_USERNAME")
-        password = os.getenv("SERVICENOW_PASSWORD")
-        if not client_id or not client_secret or not username or not password:
-            raise ValueError(
-                "SERVICENOW_CLIENT_ID, SERVICENOW_CLIENT_SECRET, "
-                "SERVICENOW_USERNAME, and SERVICENOW_PASSWORD are required for oauth"
-            )
-        token_url = os.getenv("SERVICENOW_TOKEN_URL")
-        if not token_url:
-            token_url = f"{instance_url}/oauth_token.do"
-            logger.warning("SERVICENOW_TOKEN_URL not set, defaulting to %s", token_url)
-        auth_config = AuthConfig(
-            type=auth_type,
-            oauth=OAuthConfig(
-                client_id=client_id,
-                client_secret=client_secret,
-                username=username,
-                password=password,
-                token_url=token_url,
-            ),
-        )
-
+    auth_config = build_auth(instance_url)
     return ServerConfig(instance_url=instance_url, auth=auth_config)
 
 
@@ -245,9 +729,37 @@ def main():
     parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8080, help="Port to listen on")
     parser.add_argument("--debug", action="store_true", default=False, help="Enable debug mode")
+    parser.add_argument(
+        "--workers", type=int, help="Number of worker processes (env: MCP_WORKERS, default: 1)"
+    )
+    parser.add_argument(
+        "--limit-concurrency",
+        type=int,
+        help="Max concurrent connections before returning 503 (env: MCP_LIMIT_CONCURRENCY)",
+    )
+    parser.add_argument(
+        "--backlog",
+        type=int,
+        help="Max pending connections in the listen queue (env: MCP_BACKLOG, default: 2048)",
+    )
+    parser.add_argument(
+        "--timeout-keep-alive",
+        type=int,
+        help="Keep-alive timeout in seconds (env: MCP_TIMEOUT_KEEP_ALIVE, default: 75)",
+    )
     args = parser.parse_args()
 
     try:
+        cli_overrides = {
+            "workers": args.workers,
+            "limit_concurrency": args.limit_concurrency,
+            "backlog": args.backlog,
+            "timeout_keep_alive": args.timeout_keep_alive,
+        }
+        settings = replace(
+            _load_settings(),
+            **{name: value for name, value in cli_overrides.items() if value is not None},
+        )
         config = create_config_from_env()
         logger.info(
             "Starting SSE server for %s with %s auth",
@@ -255,7 +767,7 @@ def main():
             config.auth.type.value,
         )
         server = ServiceNowSSEMCP(config)
-        server.start(host=args.host, port=args.port, debug=args.debug)
+        server.start(host=args.host, port=args.port, debug=args.debug, settings=settings)
     except ValueError as e:
         logger.error("Configuration error: %s", e)
         sys.exit(1)
@@ -138,6 +138,25 @@ class TestCreateConfigFromEnv(unittest.TestCase):
         with self.assertRaises(ValueError):
             fn()
 
+    @patch.dict(
+        os.environ,
+        {
+            "SERVICENOW_INSTANCE_URL": "https://test.service-now.com",
+            "SERVICENOW_AUTH_TYPE": "oauth",
+            "SERVICENOW_CLIENT_ID": "cid",
+            "SERVICENOW_USERNAME": "user",
+        },
+        clear=True,
+    )
+    def test_missing_credentials_error_names_only_missing_vars(self):
+        fn = self._import()
+        with self.assertRaises(ValueError) as ctx:
+            fn()
+        message = str(ctx.exception)
+        self.assertIn("SERVICENOW_CLIENT_SECRET", message)
+        self.assertIn("SERVICENOW_PASSWORD", message)
+        self.assertNotIn("SERVICENOW_CLIENT_ID", message)
+
     @patch.dict(
         os.environ,
         {
@@ -172,7 +191,9 @@ class TestCreateConfigFromEnv(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
-def _make_test_client(api_key: str, header_name: str = None) -> TestClient:
+def _make_test_client(
+    api_key: str, header_name: str = None, bypass_paths: frozenset = frozenset()
+) -> TestClient:
     """Build a minimal Starlette app with ApiKeyMiddleware applied."""
     from starlette.applications import Starlette
     from starlette.responses import PlainTextResponse
@@ -183,8 +204,10 @@ def _make_test_client(api_key: str, header_name: str = None) -> TestClient:
     async def homepage(request):
         return PlainTextResponse("OK")
 
-    app = Starlette(routes=[Route("/", homepage)])
-    app.add_middleware(ApiKeyMiddleware, api_key=api_key, header_name=header_name)
+    app = Starlette(routes=[Route("/", homepage), Route("/healthz", homepage)])
+    app.add_middleware(
+        ApiKeyMiddleware, api_key=api_key, header_name=header_name, bypass_paths=bypass_paths
+    )
     return TestClient(app, raise_server_exceptions=False)
 
 
@@ -242,6 +265,12 @@ class TestApiKeyMiddleware(unittest.TestCase):
         self.assertEqual(data["error"], "Unauthorized")
         self.assertIn("message", data)
 
+    def test_rejection_sets_length_and_closes_connection(self):
+        client = _make_test_client("secret")
+        response = client.get("/")
+        self.assertEqual(response.headers["content-length"], str(len(response.content)))
+        self.assertEqual(response.headers["connection"], "close")
+
     def test_empty_string_api_key_is_not_treated_as_disabled(self):
         """An empty-string key should still reject requests without the key."""
         client = _make_test_client("")
@@ -249,6 +278,68 @@ class TestApiKeyMiddleware(unittest.TestCase):
         response = client.get("/", headers={"Authorization": "Bearer something"})
         self.assertEqual(response.status_code, 401)
 
+    def test_non_bearer_authorization_falls_back_to_x_api_key(self):
+        client = _make_test_client("secret-key-123")
+        response = client.get(
+            "/",
+            headers={"Authorization": "Basic dXNlcjpwYXNz", "X-API-Key": "secret-key-123"},
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_bypass_path_served_without_key(self):
+        client = _make_test_client("secret-key-123", bypass_paths=frozenset({"/healthz"}))
+        self.assertEqual(client.get("/healthz").status_code, 200)
+        self.assertEqual(client.get("/").status_code, 401)
+
+    def test_lifespan_scope_passes_through(self):
+        """Non-HTTP scopes (lifespan) must reach the app without a key check."""
+        with _make_test_client("secret-key-123") as client:
+            response = client.get("/", headers={"X-API-Key": "secret-key-123"})
+        self.assertEqual(response.status_code, 200)
+
+
+class TestApiKeyMiddlewareStreaming(unittest.TestCase):
+    """Verify that authorized streaming responses pass through unbuffered."""
+
+    def test_sse_events_forwarded_as_they_are_sent(self):
+        import anyio
+
+        from servicenow_mcp.server_sse import ApiKeyMiddleware
+
+        event_count = 1000
+        delivered = []
+
+        async def sse_app(scope, receive, send):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [(b"content-type", b"text/event-stream")],
+                }
+            )
+            for i in range(event_count):
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": f"data: {i}\n\n".encode(),
+                        "more_body": True,
+                    }
+                )
+                # The event must have reached the client before the next one is produced.
+                self.assertEqual(len(delivered), i + 1)
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+        async def send(message):
+            if message["type"] == "http.response.body" and message["body"]:
+                delivered.append(message["body"])
+
+        middleware = ApiKeyMiddleware(sse_app, api_key="secret")
+        scope = {"type": "http", "path": "/sse", "headers": [(b"x-api-key", b"secret")]}
+        anyio.run(middleware, scope, None, send)
+
+        self.assertEqual(len(delivered), event_count)
+        self.assertEqual(delivered[-1], b"data: 999\n\n")
+
 
 # ---------------------------------------------------------------------------
 # Tests that middleware is skipped when MCP_SERVER_API_KEY is not set
@@ -309,5 +400,585 @@ class TestMiddlewareDisabledWhenNoKey(unittest.TestCase):
         self.assertEqual(call_kwargs.get("inbound_api_key"), "my-secret")
 
 
+# ---------------------------------------------------------------------------
+# Tests for the app built by create_starlette_app()
+# ---------------------------------------------------------------------------
+
+
+def _make_app_client(**kwargs) -> TestClient:
+    """Build the real SSE app around a ServiceNowSSEMCP server."""
+    from servicenow_mcp.server_sse import ServiceNowSSEMCP, create_starlette_app
+
+    server = ServiceNowSSEMCP(
+        {
+            "instance_url": "https://test.service-now.com",
+            "auth": {"type": "basic", "basic": {"username": "u", "password": "p"}},
+        }
+    )
+    return TestClient(
+        create_starlette_app(server.mcp_server, **kwargs), raise_server_exceptions=False
+    )
+
+
+class TestCreateStarletteApp(unittest.TestCase):
+    """Tests for the routes and middleware wiring of create_starlette_app()."""
+
+    def test_healthz_served_without_key(self):
+        client = _make_app_client(inbound_api_key="secret")
+        response = client.get("/healthz")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"status": "ok"})
+
+    def test_messages_rejected_without_key(self):
+        client = _make_app_client(inbound_api_key="secret")
+        response = client.post("/messages/?session_id=" + "0" * 32, json={})
+        self.assertEqual(response.status_code, 401)
+
+    def test_messages_reach_transport_with_key(self):
+        client = _make_app_client(inbound_api_key="secret")
+        response = client.post(
+            "/messages/?session_id=" + "0" * 32,
+            json={},
+            headers={"Authorization": "Bearer secret"},
+        )
+        # Past the middleware, the transport reports the unknown session.
+        self.assertEqual(response.status_code, 404)
+
+    def test_sse_route_is_get_only(self):
+        client = _make_app_client(inbound_api_key="secret")
+        response = client.post("/sse", headers={"Authorization": "Bearer secret"})
+        self.assertEqual(response.status_code, 405)
+
+    def test_quota_checked_before_inbound_key(self):
+        """An over-limit /sse request gets 429 even without a key."""
+        import anyio
+        from sse_starlette.sse import AppStatus
+
+        from servicenow_mcp.server_sse import create_starlette_app
+
+        # sse_starlette caches an anyio.Event bound to the first event loop.
+        AppStatus.should_exit_event = None
+        self.addCleanup(setattr, AppStatus, "should_exit_event", None)
+
+        app = create_starlette_app(
+            _SessionCountServer(), inbound_api_key="secret", sse_max_conn_per_ip=1
+        )
+        statuses = []
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
+
+        async def scenario():
+            gone = anyio.Event()
+
+            async def receive():
+                await gone.wait()
+                return {"type": "http.disconnect"}
+
+            authorized = _sse_scope()
+            authorized["headers"] = [(b"authorization", b"Bearer secret")]
+            with anyio.fail_after(2):
+                async with anyio.create_task_group() as tg:
+                    tg.start_soon(app, authorized, receive, send)
+                    await anyio.sleep(0.05)
+                    await app(_sse_scope(), receive, send)
+                    gone.set()
+                await app(_sse_scope(), receive, send)
+
+        anyio.run(scenario)
+        self.assertEqual(statuses, [200, 429, 401])
+
+
+# ---------------------------------------------------------------------------
+# Tests for uvicorn settings passed by ServiceNowSSEMCP.start()
+# ---------------------------------------------------------------------------
+
+
+class TestUvicornSettings(unittest.TestCase):
+    """Verify that start() forwards worker and concurrency settings to uvicorn."""
+
+    def _make_server(self):
+        from servicenow_mcp.server_sse import ServiceNowSSEMCP, create_config_from_env
+
+        return ServiceNowSSEMCP(create_config_from_env())
+
+    @patch.dict(
+        os.environ,
+        {
+            "SERVICENOW_INSTANCE_URL": "https://test.service-now.com",
+            "SERVICENOW_USERNAME": "u",
+            "SERVICENOW_PASSWORD": "p",
+        },
+        clear=True,
+    )
+    @patch("uvicorn.run")
+    @patch("servicenow_mcp.server_sse.create_starlette_app")
+    def test_single_worker_runs_app_instance(self, mock_create_app, mock_uvicorn):
+        app = MagicMock()
+        mock_create_app.return_value = app
+
+        from servicenow_mcp.server_sse import _SseRuntimeSettings
+
+        settings = _SseRuntimeSettings(limit_concurrency=100, backlog=512, timeout_keep_alive=30)
+        self._make_server().start(settings=settings)
+
+        args, kwargs = mock_uvicorn.call_args
+        self.assertIs(args[0], app)
+        self.assertEqual(kwargs["limit_concurrency"], 100)
+        self.assertEqual(kwargs["backlog"], 512)
+        self.assertEqual(kwargs["timeout_keep_alive"], 30)
+        self.assertNotIn("workers", kwargs)
+
+    @patch.dict(
+        os.environ,
+        {
+            "SERVICENOW_INSTANCE_URL": "https://test.service-now.com",
+            "SERVICENOW_USERNAME": "u",
+            "SERVICENOW_PASSWORD": "p",
+        },
+        clear=True,
+    )
+    @patch("uvicorn.run")
+    @patch("servicenow_mcp.server_sse.create_starlette_app")
+    def test_multiple_workers_use_app_factory(self, mock_create_app, mock_uvicorn):
+        from servicenow_mcp.server_sse import _SseRuntimeSettings
+
+        self._make_server().start(settings=_SseRuntimeSettings(workers=4))
+
+        mock_create_app.assert_not_called()
+        args, kwargs = mock_uvicorn.call_args
+        self.assertEqual(args[0], "servicenow_mcp.server_sse:_app_factory")
+        self.assertTrue(kwargs["factory"])
+        self.assertEqual(kwargs["workers"], 4)
+
+    @patch.dict(
+        os.environ,
+        {
+            "SERVICENOW_INSTANCE_URL": "https://test.service-now.com",
+            "SERVICENOW_AUTH_TYPE": "oauth",
+            "SERVICENOW_CLIENT_ID": "cid",
+            "SERVICENOW_CLIENT_SECRET": "csecret",
+            "SERVICENOW_USERNAME": "u",
+            "SERVICENOW_PASSWORD": "p",
+        },
+        clear=True,
+    )
+    @patch("uvicorn.run")
+    def test_multiple_workers_check_does_not_repeat_config_warnings(self, mock_uvicorn):
+        from servicenow_mcp.server_sse import _SseRuntimeSettings
+
+        with self.assertLogs("servicenow_mcp.server_sse", level="WARNING") as logs:
+            self._make_server().start(settings=_SseRuntimeSettings(workers=4))
+
+        token_url_warnings = [line for line in logs.output if "SERVICENOW_TOKEN_URL" in line]
+        self.assertEqual(len(token_url_warnings), 1)
+        mock_uvicorn.assert_called_once()
+
+    @patch.dict(
+        os.environ,
+        {
+            "SERVICENOW_INSTANCE_URL": "https://test.service-now.com",
+            "SERVICENOW_USERNAME": "u",
+            "SERVICENOW_PASSWORD": "p",
+        },
+        clear=True,
+    )
+    @patch("uvicorn.run")
+    def test_multiple_workers_reject_settings_not_from_env(self, mock_uvicorn):
+        from servicenow_mcp.server_sse import _SseRuntimeSettings
+
+        settings = _SseRuntimeSettings(inbound_api_key="k", workers=4)
+        with self.assertRaises(ValueError):
+            self._make_server().start(settings=settings)
+        mock_uvicorn.assert_not_called()
+
+    @patch.dict(os.environ, {}, clear=True)
+    @patch("uvicorn.run")
+    def test_multiple_workers_reject_config_not_from_env(self, mock_uvicorn):
+        from servicenow_mcp.server_sse import ServiceNowSSEMCP, _SseRuntimeSettings
+
+        server = ServiceNowSSEMCP(
+            {
+                "instance_url": "https://test.service-now.com",
+                "auth": {"type": "basic", "basic": {"username": "u", "password": "p"}},
+            }
+        )
+        with self.assertRaises(ValueError):
+            server.start(settings=_SseRuntimeSettings(workers=4))
+        mock_uvicorn.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Tests for ConnectionQuotaMiddleware
+# ---------------------------------------------------------------------------
+
+
+class _SessionCountServer:
+    """Stand-in for the MCP Server whose sessions run until they are cancelled."""
+
+    def __init__(self):
+        self.active = 0
+
+    def create_initialization_options(self):
+        return None
+
+    async def run(self, read_stream, write_stream, initialization_options):
+        import anyio
+
+        self.active += 1
+        try:
+            await anyio.sleep_forever()
+        finally:
+            self.active -= 1
+
+
+def _sse_scope(ip="10.0.0.1"):
+    """Build an ASGI scope for GET /sse from the given client IP."""
+    return {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/sse",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": (ip, 1234),
+        "server": ("testserver", 80),
+    }
+
+
+class TestConnectionQuotaMiddleware(unittest.TestCase):
+    """Tests for the per-IP /sse connection cap."""
+
+    def test_connections_over_limit_rejected_until_slot_frees(self):
+        import anyio
+
+        from servicenow_mcp.server_sse import ConnectionQuotaMiddleware
+
+        release = anyio.Event()
+
+        async def streaming_app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await release.wait()
+            await send({"type": "http.response.body", "body": b""})
+
+        middleware = ConnectionQuotaMiddleware(streaming_app, limit=1)
+
+        async def request(ip):
+            statuses = []
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    statuses.append(message["status"])
+
+            scope = {"type": "http", "path": "/sse", "headers": [], "client": (ip, 1234)}
+            await middleware(scope, None, send)
+            return statuses[0]
+
+        async def scenario():
+            results = {}
+
+            async def hold(key, ip):
+                results[key] = await request(ip)
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(hold, "first", "10.0.0.1")
+                tg.start_soon(hold, "other_ip", "10.0.0.2")
+                await anyio.sleep(0.01)
+                results["second"] = await request("10.0.0.1")
+                release.set()
+            results["after_release"] = await request("10.0.0.1")
+            return results
+
+        results = anyio.run(scenario)
+        self.assertEqual(results["first"], 200)
+        self.assertEqual(results["other_ip"], 200)
+        self.assertEqual(results["second"], 429)
+        self.assertEqual(results["after_release"], 200)
+        self.assertEqual(middleware._counts, {})
+
+    def test_disconnect_ends_sse_session_and_frees_slot(self):
+        """With mcp's transport the session outlives the stream unless cancelled."""
+        import anyio
+        from sse_starlette.sse import AppStatus
+
+        from servicenow_mcp.server_sse import create_starlette_app
+
+        # sse_starlette caches an anyio.Event bound to the first event loop.
+        AppStatus.should_exit_event = None
+        self.addCleanup(setattr, AppStatus, "should_exit_event", None)
+
+        server = _SessionCountServer()
+        app = create_starlette_app(server, sse_idle_timeout_sec=0, sse_max_conn_per_ip=1)
+        statuses = []
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
+
+        def receive_until(disconnected):
+            async def receive():
+                await disconnected.wait()
+                return {"type": "http.disconnect"}
+
+            return receive
+
+        async def scenario():
+            first_gone = anyio.Event()
+            with anyio.fail_after(2):
+                async with anyio.create_task_group() as tg:
+                    tg.start_soon(app, _sse_scope(), receive_until(first_gone), send)
+                    await anyio.sleep(0.05)
+                    sessions_while_connected = server.active
+                    await app(_sse_scope(), receive_until(anyio.Event()), send)
+                    first_gone.set()
+                sessions_after_disconnect = server.active
+
+                second_gone = anyio.Event()
+                async with anyio.create_task_group() as tg:
+                    tg.start_soon(app, _sse_scope(), receive_until(second_gone), send)
+                    await anyio.sleep(0.05)
+                    second_gone.set()
+            return sessions_while_connected, sessions_after_disconnect
+
+        # The task groups above only exit once the /sse handler has returned.
+        self.assertEqual(anyio.run(scenario), (1, 0))
+        self.assertEqual(statuses, [200, 429, 200])
+        self.assertEqual(server.active, 0)
+
+    def test_other_paths_not_counted(self):
+        import anyio
+
+        from servicenow_mcp.server_sse import ConnectionQuotaMiddleware
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        middleware = ConnectionQuotaMiddleware(app, limit=0)
+        statuses = []
+
+        async def send(message):
+            statuses.append(message["status"])
+
+        scope = {"type": "http", "path": "/messages/", "headers": [], "client": ("1.2.3.4", 1)}
+        anyio.run(middleware, scope, None, send)
+        self.assertEqual(statuses, [200])
+
+
+# ---------------------------------------------------------------------------
+# Tests for /sse streaming response headers
+# ---------------------------------------------------------------------------
+
+
+class TestSseHeaders(unittest.TestCase):
+    """Tests for _with_sse_headers()."""
+
+    def _send_through(self, message):
+        import anyio
+
+        from servicenow_mcp.server_sse import _with_sse_headers
+
+        sent = []
+
+        async def send(msg):
+            sent.append(msg)
+
+        anyio.run(_with_sse_headers(send), message)
+        return sent[0]
+
+    def test_streaming_headers_added_to_response_start(self):
+        message = self._send_through(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"cache-control", b"no-cache")],
+            }
+        )
+        headers = dict(message["headers"])
+        self.assertEqual(headers[b"cache-control"], b"no-store")
+        self.assertEqual(headers[b"x-accel-buffering"], b"no")
+        self.assertEqual(headers[b"connection"], b"keep-alive")
+        self.assertEqual(headers[b"content-type"], b"text/event-stream")
+        self.assertEqual(len(message["headers"]), 4)
+
+    def test_existing_content_type_kept(self):
+        message = self._send_through(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"text/event-stream; charset=utf-8")],
+            }
+        )
+        self.assertEqual(
+            dict(message["headers"])[b"content-type"], b"text/event-stream; charset=utf-8"
+        )
+
+    def test_body_messages_pass_through(self):
+        body = {"type": "http.response.body", "body": b"data: 1\n\n", "more_body": True}
+        self.assertIs(self._send_through(body), body)
+
+
+# ---------------------------------------------------------------------------
+# Tests for SSE session idle timeout
+# ---------------------------------------------------------------------------
+
+
+class _EchoCountServer:
+    """Stand-in for the MCP Server that just drains the client message stream."""
+
+    def __init__(self):
+        self.received = []
+
+    async def run(self, read_stream, write_stream, initialization_options):
+        async for message in read_stream:
+            self.received.append(message)
+
+
+class TestIdleTimeout(unittest.TestCase):
+    """Tests for _run_with_idle_timeout()."""
+
+    def test_idle_session_is_closed(self):
+        import anyio
+
+        from servicenow_mcp.server_sse import _run_with_idle_timeout
+
+        async def scenario():
+            client_send, read_stream = anyio.create_memory_object_stream(1)
+            write_stream, write_reader = anyio.create_memory_object_stream(1)
+            async with client_send:
+                with anyio.fail_after(2):
+                    await _run_with_idle_timeout(
+                        _EchoCountServer().run, read_stream, write_stream, None, 0.05
+                    )
+                # The read side is closed so late client messages fail fast.
+                with self.assertRaises(anyio.BrokenResourceError):
+                    await client_send.send("late")
+            # The write side is closed so the transport can finish the response.
+            with self.assertRaises(anyio.EndOfStream):
+                await write_reader.receive()
+
+        anyio.run(scenario)
+
+    def test_client_messages_keep_session_alive(self):
+        import anyio
+
+        from servicenow_mcp.server_sse import _run_with_idle_timeout
+
+        server = _EchoCountServer()
+
+        async def scenario():
+            client_send, read_stream = anyio.create_memory_object_stream(1)
+            write_stream, _ = anyio.create_memory_object_stream(1)
+
+            async def send_messages():
+                for i in range(10):
+                    await client_send.send(i)
+                    await anyio.sleep(0.03)
+
+            async with client_send, anyio.create_task_group() as tg:
+                tg.start_soon(send_messages)
+                with anyio.fail_after(2):
+                    await _run_with_idle_timeout(server.run, read_stream, write_stream, None, 0.1)
+
+        anyio.run(scenario)
+        self.assertEqual(server.received, list(range(10)))
+
+
+class TestSseKeepaliveInterval(unittest.TestCase):
+    """Tests for _set_sse_keepalive_interval()."""
+
+    def setUp(self):
+        from sse_starlette.sse import EventSourceResponse
+
+        original = EventSourceResponse.DEFAULT_PING_INTERVAL
+        self.addCleanup(setattr, EventSourceResponse, "DEFAULT_PING_INTERVAL", original)
+
+    def test_sets_ping_interval(self):
+        from sse_starlette.sse import EventSourceResponse
+
+        from servicenow_mcp.server_sse import _set_sse_keepalive_interval
+
+        _set_sse_keepalive_interval(7)
+        self.assertEqual(EventSourceResponse.DEFAULT_PING_INTERVAL, 7)
+
+    def test_non_positive_interval_rejected(self):
+        from sse_starlette.sse import EventSourceResponse
+
+        from servicenow_mcp.server_sse import _set_sse_keepalive_interval
+
+        before = EventSourceResponse.DEFAULT_PING_INTERVAL
+        with self.assertRaises(ValueError):
+            _set_sse_keepalive_interval(0)
+        self.assertEqual(EventSourceResponse.DEFAULT_PING_INTERVAL, before)
+
+
+class TestLoadSettings(unittest.TestCase):
+    """Tests for _load_settings() env var parsing."""
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_defaults_when_env_empty(self):
+        from servicenow_mcp.server_sse import _load_settings, _SseRuntimeSettings
+
+        self.assertEqual(_load_settings(), _SseRuntimeSettings())
+
+    @patch.dict(
+        os.environ,
+        {
+            "MCP_SERVER_API_KEY": "k",
+            "MCP_SERVER_API_KEY_HEADER": "X-Custom-Auth",
+            "MCP_WORKERS": "3",
+            "MCP_LIMIT_CONCURRENCY": "200",
+        },
+        clear=True,
+    )
+    def test_values_read_from_env(self):
+        from servicenow_mcp.server_sse import _load_settings
+
+        settings = _load_settings()
+        self.assertEqual(settings.inbound_api_key, "k")
+        self.assertEqual(settings.inbound_api_key_header, "X-Custom-Auth")
+        self.assertEqual(settings.workers, 3)
+        self.assertEqual(settings.limit_concurrency, 200)
+
+    @patch.dict(os.environ, {"MCP_SERVER_API_KEY_BYPASS_PATHS": "/healthz, /metrics,"}, clear=True)
+    def test_bypass_paths_parsed_from_env(self):
+        from servicenow_mcp.server_sse import _load_settings
+
+        settings = _load_settings()
+        self.assertEqual(settings.inbound_api_key_bypass_paths, frozenset({"/healthz", "/metrics"}))
+
+    @patch.dict(os.environ, {"MCP_WORKERS": "many"}, clear=True)
+    def test_non_integer_value_raises(self):
+        from servicenow_mcp.server_sse import _load_settings
+
+        with self.assertRaises(ValueError):
+            _load_settings()
+
+    @patch.dict(os.environ, {"MCP_WORKERS": "0"}, clear=True)
+    def test_out_of_range_env_value_raises(self):
+        from servicenow_mcp.server_sse import _load_settings
+
+        with self.assertRaises(ValueError):
+            _load_settings()
+
+    @patch.dict(os.environ, {"MCP_SSE_KEEPALIVE_SEC": "0"}, clear=True)
+    def test_non_positive_keepalive_raises(self):
+        from servicenow_mcp.server_sse import _load_settings
+
+        with self.assertRaises(ValueError):
+            _load_settings()
+
+    def test_out_of_range_override_raises(self):
+        """CLI overrides go through the same checks as env values."""
+        from dataclasses import replace
+
+        from servicenow_mcp.server_sse import _SseRuntimeSettings
+
+        with self.assertRaises(ValueError):
+            replace(_SseRuntimeSettings(), backlog=-1)
+
+
 if __name__ == "__main__":
     unittest.main()